@@ -4,10 +4,47 @@ Data structures for the CSS abstract syntax tree.
 
 """
 
+import sys
+from functools import lru_cache
+from io import StringIO
 
-from webencodings import ascii_lower
+from .serializer import (
+    BAD_PAIRS, _serialize_to, serialize_identifier, serialize_name)
 
-from .serializer import _serialize_to, serialize_identifier, serialize_name
+# Translate table lowercasing only A-Z,
+# as per https://www.w3.org/TR/css-syntax-3/
+_ASCII_LOWER = str.maketrans({c: c + 0x20 for c in range(0x41, 0x5B)})
+
+
+@lru_cache(maxsize=1024)
+def _ascii_lower_cached(string):
+    """ASCII-lowercase ``string``, caching the result.
+
+    The same few identifiers, units and function names recur thousands of
+    times in a typical stylesheet, so repeated values come straight out of
+    the cache. Most of them are already lowercase ASCII and are returned
+    as-is, without building a second string.
+
+    The result is interned: consumers compare ``lower_value`` & co. to CSS
+    keywords over and over, and equality between interned strings is a
+    pointer comparison.
+
+    """
+    if string.isascii() and string.islower():
+        return sys.intern(string)
+    return sys.intern(string.translate(_ASCII_LOWER))
+
+
+# CSS serialization of each ParseError kind.
+_PARSE_ERROR_SERIALIZATIONS = {
+    'bad-string': '"[bad string]\n',
+    'bad-url': 'url([bad url])',
+    ')': ')',
+    ']': ']',
+    '}': '}',
+    'eof-in-string': '',
+    'eof-in-url': '',
+}
 
 
 class Node:
@@ -54,14 +91,11 @@ class Node:
         self.source_line = source_line
         self.source_column = source_column
 
-    def __repr__(self):
-        return self.repr_format.format(self=self)
-
     def serialize(self):
         """Serialize this node to CSS syntax and return a Unicode string."""
-        chunks = []
-        self._serialize_to(chunks.append)
-        return ''.join(chunks)
+        output = StringIO()
+        self._serialize_to(output.write)
+        return output.getvalue()
 
     def _serialize_to(self, write):
         """Serialize this node to CSS syntax, writing chunks as Unicode string
@@ -95,24 +129,20 @@ class ParseError(Node):
     """
     __slots__ = ['kind', 'message']
     type = 'error'
-    repr_format = '<{self.__class__.__name__} {self.kind}>'
 
     def __init__(self, line, column, kind, message):
         Node.__init__(self, line, column)
         self.kind = kind
         self.message = message
 
+    def __repr__(self):
+        return f'<ParseError {self.kind}>'
+
     def _serialize_to(self, write):
-        if self.kind == 'bad-string':
-            write('"[bad string]\n')
-        elif self.kind == 'bad-url':
-            write('url([bad url])')
-        elif self.kind in ')]}':
-            write(self.kind)
-        elif self.kind in ('eof-in-string', 'eof-in-url'):
-            pass
-        else:  # pragma: no cover
+        serialization = _PARSE_ERROR_SERIALIZATIONS.get(self.kind)
+        if serialization is None:  # pragma: no cover
             raise TypeError('Can not serialize %r' % self)
+        write(serialization)
 
 
 class Comment(Node):
@@ -130,12 +160,14 @@ class Comment(Node):
     """
     __slots__ = ['value']
     type = 'comment'
-    repr_format = '<{self.__class__.__name__} {self.value}>'
 
     def __init__(self, line, column, value):
         Node.__init__(self, line, column)
         self.value = value
 
+    def __repr__(self):
+        return f'<Comment {self.value}>'
+
     def _serialize_to(self, write):
         write('/*')
         write(self.value)
@@ -155,12 +187,14 @@ class WhitespaceToken(Node):
     """
     __slots__ = ['value']
     type = 'whitespace'
-    repr_format = '<{self.__class__.__name__}>'
 
     def __init__(self, line, column, value):
         Node.__init__(self, line, column)
         self.value = value
 
+    def __repr__(self):
+        return '<WhitespaceToken>'
+
     def _serialize_to(self, write):
         write(self.value)
 
@@ -202,18 +236,25 @@ class LiteralToken(Node):
     """
     __slots__ = ['value']
     type = 'literal'
-    repr_format = '<{self.__class__.__name__} {self.value}>'
 
     def __init__(self, line, column, value):
         Node.__init__(self, line, column)
-        self.value = value
+        # There are only a few dozen distinct literal values, interning
+        # them makes the == below a pointer comparison in common cases.
+        self.value = sys.intern(value)
 
     def __eq__(self, other):
-        return self.value == other or self is other
+        return self is other or self.value == other
 
     def __ne__(self, other):
         return not self == other
 
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return f'<LiteralToken {self.value}>'
+
     def _serialize_to(self, write):
         write(self.value)
 
@@ -229,25 +270,36 @@ class IdentToken(Node):
 
     .. attribute:: lower_value
 
-        Same as :attr:`value` but normalized to *ASCII lower case*,
-        see :func:`~webencodings.ascii_lower`.
+        Same as :attr:`value` but normalized to *ASCII lower case*
+        (only A-Z is lowercased, non-ASCII characters are kept as-is).
         This is the value to use when comparing to a CSS keyword.
+        Computed on first access.
 
     """
-    __slots__ = ['value', 'lower_value']
+    __slots__ = ['value', '_lower_value', '_serialized']
     type = 'ident'
-    repr_format = '<{self.__class__.__name__} {self.value}>'
 
     def __init__(self, line, column, value):
         Node.__init__(self, line, column)
         self.value = value
-        try:
-            self.lower_value = ascii_lower(value)
-        except UnicodeEncodeError:
-            self.lower_value = value
+        self._lower_value = None
+        self._serialized = None
+
+    @property
+    def lower_value(self):
+        lower_value = self._lower_value
+        if lower_value is None:
+            lower_value = self._lower_value = _ascii_lower_cached(self.value)
+        return lower_value
+
+    def __repr__(self):
+        return f'<IdentToken {self.value}>'
 
     def _serialize_to(self, write):
-        write(serialize_identifier(self.value))
+        serialized = self._serialized
+        if serialized is None:
+            serialized = self._serialized = serialize_identifier(self.value)
+        write(serialized)
 
 
 class AtKeywordToken(Node):
@@ -265,30 +317,41 @@ class AtKeywordToken(Node):
 
     .. attribute:: lower_value
 
-        Same as :attr:`value` but normalized to *ASCII lower case*,
-        see :func:`~webencodings.ascii_lower`.
+        Same as :attr:`value` but normalized to *ASCII lower case*
+        (only A-Z is lowercased, non-ASCII characters are kept as-is).
         This is the value to use when comparing to a CSS at-keyword.
+        Computed on first access.
 
         .. code-block:: python
 
             if node.type == 'at-keyword' and node.lower_value == 'import':
 
     """
-    __slots__ = ['value', 'lower_value']
+    __slots__ = ['value', '_lower_value', '_serialized']
     type = 'at-keyword'
-    repr_format = '<{self.__class__.__name__} @{self.value}>'
 
     def __init__(self, line, column, value):
         Node.__init__(self, line, column)
         self.value = value
-        try:
-            self.lower_value = ascii_lower(value)
-        except UnicodeEncodeError:
-            self.lower_value = value
+        self._lower_value = None
+        self._serialized = None
+
+    @property
+    def lower_value(self):
+        lower_value = self._lower_value
+        if lower_value is None:
+            lower_value = self._lower_value = _ascii_lower_cached(self.value)
+        return lower_value
+
+    def __repr__(self):
+        return f'<AtKeywordToken @{self.value}>'
 
     def _serialize_to(self, write):
-        write('@')
-        write(serialize_identifier(self.value))
+        serialized = self._serialized
+        if serialized is None:
+            serialized = self._serialized = (
+                '@' + serialize_identifier(self.value))
+        write(serialized)
 
 
 class HashToken(Node):
@@ -313,13 +376,15 @@ class HashToken(Node):
     """
     __slots__ = ['value', 'is_identifier']
     type = 'hash'
-    repr_format = '<{self.__class__.__name__} #{self.value}>'
 
     def __init__(self, line, column, value, is_identifier):
         Node.__init__(self, line, column)
         self.value = value
         self.is_identifier = is_identifier
 
+    def __repr__(self):
+        return f'<HashToken #{self.value}>'
+
     def _serialize_to(self, write):
         write('#')
         if self.is_identifier:
@@ -328,7 +393,21 @@ class HashToken(Node):
             write(serialize_name(self.value))
 
 
-class StringToken(Node):
+class _ValueRepresentationToken(Node):
+    """Base class for tokens with an unescaped value and its CSS
+    representation, sharing a single slot layout and serialization."""
+    __slots__ = ['value', 'representation']
+
+    def __init__(self, line, column, value, representation):
+        Node.__init__(self, line, column)
+        self.value = value
+        self.representation = representation
+
+    def _serialize_to(self, write):
+        write(self.representation)
+
+
+class StringToken(_ValueRepresentationToken):
     """A :diagram:`string-token`.
 
     .. code-block:: text
@@ -342,20 +421,14 @@ class StringToken(Node):
         The unescaped value, as a Unicode string, without the quotes.
 
     """
-    __slots__ = ['value', 'representation']
+    __slots__ = []
     type = 'string'
-    repr_format = '<{self.__class__.__name__} {self.representation}>'
-
-    def __init__(self, line, column, value, representation):
-        Node.__init__(self, line, column)
-        self.value = value
-        self.representation = representation
 
-    def _serialize_to(self, write):
-        write(self.representation)
+    def __repr__(self):
+        return f'<StringToken {self.representation}>'
 
 
-class URLToken(Node):
+class URLToken(_ValueRepresentationToken):
     """An :diagram:`url-token`.
 
     .. code-block:: text
@@ -370,17 +443,11 @@ class URLToken(Node):
         markers.
 
     """
-    __slots__ = ['value', 'representation']
+    __slots__ = []
     type = 'url'
-    repr_format = '<{self.__class__.__name__} {self.representation}>'
-
-    def __init__(self, line, column, value, representation):
-        Node.__init__(self, line, column)
-        self.value = value
-        self.representation = representation
 
-    def _serialize_to(self, write):
-        write(self.representation)
+    def __repr__(self):
+        return f'<URLToken {self.representation}>'
 
 
 class UnicodeRangeToken(Node):
@@ -400,21 +467,41 @@ class UnicodeRangeToken(Node):
     """
     __slots__ = ['start', 'end']
     type = 'unicode-range'
-    repr_format = '<{self.__class__.__name__} {self.start} {self.end}>'
 
     def __init__(self, line, column, start, end):
         Node.__init__(self, line, column)
         self.start = start
         self.end = end
 
+    def __repr__(self):
+        return f'<UnicodeRangeToken {self.start} {self.end}>'
+
     def _serialize_to(self, write):
-        if self.end == self.start:
-            write('U+%X' % self.start)
+        start = self.start
+        end = self.end
+        if end == start:
+            write(f'U+{start:X}')
         else:
-            write('U+%X-%X' % (self.start, self.end))
+            write(f'U+{start:X}-{end:X}')
+
 
+class _NumericToken(Node):
+    """Base class for tokens with a numeric value, its integerness and its
+    CSS representation, sharing a single slot layout and serialization."""
+    __slots__ = ['value', 'int_value', 'is_integer', 'representation']
 
-class NumberToken(Node):
+    def __init__(self, line, column, value, int_value, representation):
+        Node.__init__(self, line, column)
+        self.value = value
+        self.int_value = int_value
+        self.is_integer = int_value is not None
+        self.representation = representation
+
+    def _serialize_to(self, write):
+        write(self.representation)
+
+
+class NumberToken(_NumericToken):
     """A :diagram:`number-token`.
 
     .. autoattribute:: type
@@ -437,22 +524,14 @@ class NumberToken(Node):
         The CSS representation of the value, as a Unicode string.
 
     """
-    __slots__ = ['value', 'int_value', 'is_integer', 'representation']
+    __slots__ = []
     type = 'number'
-    repr_format = '<{self.__class__.__name__} {self.representation}>'
 
-    def __init__(self, line, column, value, int_value, representation):
-        Node.__init__(self, line, column)
-        self.value = value
-        self.int_value = int_value
-        self.is_integer = int_value is not None
-        self.representation = representation
-
-    def _serialize_to(self, write):
-        write(self.representation)
+    def __repr__(self):
+        return f'<NumberToken {self.representation}>'
 
 
-class PercentageToken(Node):
+class PercentageToken(_NumericToken):
     """A :diagram:`percentage-token`.
 
     .. code-block:: text
@@ -481,23 +560,18 @@ class PercentageToken(Node):
         as a Unicode string.
 
     """
-    __slots__ = ['value', 'int_value', 'is_integer', 'representation']
+    __slots__ = []
     type = 'percentage'
-    repr_format = '<{self.__class__.__name__} {self.representation}%>'
 
-    def __init__(self, line, column, value, int_value, representation):
-        Node.__init__(self, line, column)
-        self.value = value
-        self.int_value = int_value
-        self.is_integer = int_value is not None
-        self.representation = representation
+    def __repr__(self):
+        return f'<PercentageToken {self.representation}%>'
 
     def _serialize_to(self, write):
         write(self.representation)
         write('%')
 
 
-class DimensionToken(Node):
+class DimensionToken(_NumericToken):
     """A :diagram:`dimension-token`.
 
     .. code-block:: text
@@ -531,39 +605,48 @@ class DimensionToken(Node):
 
     .. attribute:: lower_unit
 
-        Same as :attr:`unit` but normalized to *ASCII lower case*,
-        see :func:`~webencodings.ascii_lower`.
+        Same as :attr:`unit` but normalized to *ASCII lower case*
+        (only A-Z is lowercased, non-ASCII characters are kept as-is).
         This is the value to use when comparing to a CSS unit.
+        Computed on first access.
 
         .. code-block:: python
 
             if node.type == 'dimension' and node.lower_unit == 'px':
 
     """
-    __slots__ = ['value', 'int_value', 'is_integer', 'representation',
-                 'unit', 'lower_unit']
+    __slots__ = ['unit', '_lower_unit', '_serialized_unit']
     type = 'dimension'
-    repr_format = ('<{self.__class__.__name__} '
-                   '{self.representation}{self.unit}>')
 
     def __init__(self, line, column, value, int_value, representation, unit):
-        Node.__init__(self, line, column)
-        self.value = value
-        self.int_value = int_value
-        self.is_integer = int_value is not None
-        self.representation = representation
+        _NumericToken.__init__(
+            self, line, column, value, int_value, representation)
         self.unit = unit
-        self.lower_unit = ascii_lower(unit)
+        self._lower_unit = None
+        self._serialized_unit = None
+
+    @property
+    def lower_unit(self):
+        lower_unit = self._lower_unit
+        if lower_unit is None:
+            lower_unit = self._lower_unit = _ascii_lower_cached(self.unit)
+        return lower_unit
+
+    def __repr__(self):
+        return f'<DimensionToken {self.representation}{self.unit}>'
 
     def _serialize_to(self, write):
         write(self.representation)
-        # Disambiguate with scientific notation
-        unit = self.unit
-        if unit in ('e', 'E') or unit.startswith(('e-', 'E-')):
-            write('\\65 ')
-            write(serialize_name(unit[1:]))
-        else:
-            write(serialize_identifier(unit))
+        serialized_unit = self._serialized_unit
+        if serialized_unit is None:
+            unit = self.unit
+            if unit in ('e', 'E') or unit.startswith(('e-', 'E-')):
+                # Disambiguate with scientific notation
+                serialized_unit = '\\65 ' + serialize_name(unit[1:])
+            else:
+                serialized_unit = serialize_identifier(unit)
+            self._serialized_unit = serialized_unit
+        write(serialized_unit)
 
 
 class ParenthesesBlock(Node):
@@ -583,15 +666,33 @@ class ParenthesesBlock(Node):
     """
     __slots__ = ['content']
     type = '() block'
-    repr_format = '<{self.__class__.__name__} ( … )>'
 
     def __init__(self, line, column, content):
         Node.__init__(self, line, column)
         self.content = content
 
+    def __repr__(self):
+        return '<ParenthesesBlock ( … )>'
+
     def _serialize_to(self, write):
         write('(')
-        _serialize_to(self.content, write)
+        # Inlined from serializer._serialize_to to save a function
+        # call per block; keep in sync with it.
+        bad_pairs = BAD_PAIRS
+        previous_type = None
+        for node in self.content:
+            serialization_type = (node.type if node.type != 'literal'
+                                  else node.value)
+            if (previous_type, serialization_type) in bad_pairs:
+                write('/**/')
+            elif previous_type == '\\' and not (
+                    serialization_type == 'whitespace' and
+                    node.value.startswith('\n')):
+                write('\n')
+            node._serialize_to(write)
+            if serialization_type == 'declaration':
+                write(';')
+            previous_type = serialization_type
         write(')')
 
 
@@ -612,15 +713,33 @@ class SquareBracketsBlock(Node):
     """
     __slots__ = ['content']
     type = '[] block'
-    repr_format = '<{self.__class__.__name__} [ … ]>'
 
     def __init__(self, line, column, content):
         Node.__init__(self, line, column)
         self.content = content
 
+    def __repr__(self):
+        return '<SquareBracketsBlock [ … ]>'
+
     def _serialize_to(self, write):
         write('[')
-        _serialize_to(self.content, write)
+        # Inlined from serializer._serialize_to to save a function
+        # call per block; keep in sync with it.
+        bad_pairs = BAD_PAIRS
+        previous_type = None
+        for node in self.content:
+            serialization_type = (node.type if node.type != 'literal'
+                                  else node.value)
+            if (previous_type, serialization_type) in bad_pairs:
+                write('/**/')
+            elif previous_type == '\\' and not (
+                    serialization_type == 'whitespace' and
+                    node.value.startswith('\n')):
+                write('\n')
+            node._serialize_to(write)
+            if serialization_type == 'declaration':
+                write(';')
+            previous_type = serialization_type
         write(']')
 
 
@@ -641,15 +760,33 @@ class CurlyBracketsBlock(Node):
     """
     __slots__ = ['content']
     type = '{} block'
-    repr_format = '<{self.__class__.__name__} {{ … }}>'
 
     def __init__(self, line, column, content):
         Node.__init__(self, line, column)
         self.content = content
 
+    def __repr__(self):
+        return '<CurlyBracketsBlock { … }>'
+
     def _serialize_to(self, write):
         write('{')
-        _serialize_to(self.content, write)
+        # Inlined from serializer._serialize_to to save a function
+        # call per block; keep in sync with it.
+        bad_pairs = BAD_PAIRS
+        previous_type = None
+        for node in self.content:
+            serialization_type = (node.type if node.type != 'literal'
+                                  else node.value)
+            if (previous_type, serialization_type) in bad_pairs:
+                write('/**/')
+            elif previous_type == '\\' and not (
+                    serialization_type == 'whitespace' and
+                    node.value.startswith('\n')):
+                write('\n')
+            node._serialize_to(write)
+            if serialization_type == 'declaration':
+                write(';')
+            previous_type = serialization_type
         write('}')
 
 
@@ -668,9 +805,10 @@ class FunctionBlock(Node):
 
     .. attribute:: lower_name
 
-        Same as :attr:`name` but normalized to *ASCII lower case*,
-        see :func:`~webencodings.ascii_lower`.
+        Same as :attr:`name` but normalized to *ASCII lower case*
+        (only A-Z is lowercased, non-ASCII characters are kept as-is).
         This is the value to use when comparing to a CSS function name.
+        Computed on first access.
 
     .. attribute:: arguments
 
@@ -680,28 +818,42 @@ class FunctionBlock(Node):
         in the list.
 
     """
-    __slots__ = ['name', 'lower_name', 'arguments']
+    __slots__ = ['name', '_lower_name', 'arguments', '_serialized_name']
     type = 'function'
-    repr_format = '<{self.__class__.__name__} {self.name}( … )>'
 
     def __init__(self, line, column, name, arguments):
         Node.__init__(self, line, column)
         self.name = name
-        self.lower_name = ascii_lower(name)
+        self._lower_name = None
         self.arguments = arguments
+        self._serialized_name = None
 
-    def _serialize_to(self, write):
-        write(serialize_identifier(self.name))
-        write('(')
+    @property
+    def lower_name(self):
+        lower_name = self._lower_name
+        if lower_name is None:
+            lower_name = self._lower_name = _ascii_lower_cached(self.name)
+        return lower_name
+
+    def __repr__(self):
+        return f'<FunctionBlock {self.name}( … )>'
+
+    def _serialize_to(self, write, _serialize_to=_serialize_to):
+        serialized_name = self._serialized_name
+        if serialized_name is None:
+            serialized_name = self._serialized_name = (
+                serialize_identifier(self.name) + '(')
+        write(serialized_name)
         _serialize_to(self.arguments, write)
-        function = self
-        while isinstance(function, FunctionBlock) and function.arguments:
-            eof_in_string = (
-                isinstance(function.arguments[-1], ParseError) and
-                function.arguments[-1].kind == 'eof-in-string')
-            if eof_in_string:
-                return
-            function = function.arguments[-1]
+        # Omit the closing ')' when the innermost trailing argument is an
+        # unclosed string, whose serialization swallows the rest of the
+        # input. type() identity checks are enough here: neither
+        # FunctionBlock nor ParseError is subclassed.
+        last = self
+        while type(last) is FunctionBlock and last.arguments:
+            last = last.arguments[-1]
+        if type(last) is ParseError and last.kind == 'eof-in-string':
+            return
         write(')')
 
 
@@ -721,8 +873,8 @@ class Declaration(Node):
 
     .. attribute:: lower_name
 
-        Same as :attr:`name` but normalized to *ASCII lower case*,
-        see :func:`~webencodings.ascii_lower`.
+        Same as :attr:`name` but normalized to *ASCII lower case*
+        (only A-Z is lowercased, non-ASCII characters are kept as-is).
         This is the value to use when comparing to
         a CSS property or descriptor name.
 
@@ -743,19 +895,23 @@ class Declaration(Node):
         this flag, such as non-property descriptor declarations.
 
     """
-    __slots__ = ['name', 'lower_name', 'value', 'important']
+    __slots__ = ['name', 'lower_name', 'value', 'important',
+                 '_serialized_name']
     type = 'declaration'
-    repr_format = '<{self.__class__.__name__} {self.name}: …>'
 
     def __init__(self, line, column, name, lower_name, value, important):
         Node.__init__(self, line, column)
         self.name = name
-        self.lower_name = lower_name
+        self.lower_name = sys.intern(lower_name)
         self.value = value
         self.important = important
+        self._serialized_name = serialize_identifier(name)
 
-    def _serialize_to(self, write):
-        write(serialize_identifier(self.name))
+    def __repr__(self):
+        return f'<Declaration {self.name}: …>'
+
+    def _serialize_to(self, write, _serialize_to=_serialize_to):
+        write(self._serialized_name)
         write(':')
         _serialize_to(self.value, write)
         if self.important:
@@ -790,15 +946,16 @@ class QualifiedRule(Node):
     """
     __slots__ = ['prelude', 'content']
     type = 'qualified-rule'
-    repr_format = ('<{self.__class__.__name__} '
-                   '… {{ … }}>')
 
     def __init__(self, line, column, prelude, content):
         Node.__init__(self, line, column)
         self.prelude = prelude
         self.content = content
 
-    def _serialize_to(self, write):
+    def __repr__(self):
+        return '<QualifiedRule … { … }>'
+
+    def _serialize_to(self, write, _serialize_to=_serialize_to):
         _serialize_to(self.prelude, write)
         write('{')
         _serialize_to(self.content, write)
@@ -828,8 +985,8 @@ class AtRule(Node):
 
     .. attribute:: lower_at_keyword
 
-        Same as :attr:`at_keyword` but normalized to *ASCII lower case*,
-        see :func:`~webencodings.ascii_lower`.
+        Same as :attr:`at_keyword` but normalized to *ASCII lower case*
+        (only A-Z is lowercased, non-ASCII characters are kept as-is).
         This is the value to use when comparing to a CSS at-keyword.
 
         .. code-block:: python
@@ -851,18 +1008,19 @@ class AtRule(Node):
     """
     __slots__ = ['at_keyword', 'lower_at_keyword', 'prelude', 'content']
     type = 'at-rule'
-    repr_format = ('<{self.__class__.__name__} '
-                   '@{self.at_keyword} … {{ … }}>')
 
     def __init__(self, line, column,
                  at_keyword, lower_at_keyword, prelude, content):
         Node.__init__(self, line, column)
         self.at_keyword = at_keyword
-        self.lower_at_keyword = lower_at_keyword
+        self.lower_at_keyword = sys.intern(lower_at_keyword)
         self.prelude = prelude
         self.content = content
 
-    def _serialize_to(self, write):
+    def __repr__(self):
+        return f'<AtRule @{self.at_keyword} … {{ … }}>'
+
+    def _serialize_to(self, write, _serialize_to=_serialize_to):
         write('@')
         write(serialize_identifier(self.at_keyword))
         _serialize_to(self.prelude, write)
@@ -1,3 +1,7 @@
+from functools import lru_cache
+from io import StringIO
+
+
 def serialize(nodes):
     """Serialize nodes to CSS syntax.
 
@@ -12,11 +16,12 @@ def serialize(nodes):
     :returns: A :obj:`string <str>` representing the nodes.
 
     """
-    chunks = []
-    _serialize_to(nodes, chunks.append)
-    return ''.join(chunks)
+    output = StringIO()
+    _serialize_to(nodes, output.write)
+    return output.getvalue()
 
 
+@lru_cache(maxsize=2048)
 def serialize_identifier(value):
     """Serialize any string as a CSS identifier
 
@@ -54,6 +59,7 @@ def serialize_identifier(value):
     return result
 
 
+@lru_cache(maxsize=2048)
 def serialize_name(value):
     return ''.join(
         c if c in ('abcdefghijklmnopqrstuvwxyz-_0123456789'